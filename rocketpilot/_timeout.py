@@ -71,11 +71,7 @@ class Timeout(object):
         especially on slow or virtualised hardware.
 
         """
-        timeout = float(get_default_timeout_period())
-        # Once we only support py3.3, replace this with
-        # yield from _do_timeout(timeout)
-        for i in _do_timeout(timeout):
-            yield i
+        yield from _do_timeout(float(get_default_timeout_period()))
 
     @staticmethod
     def long():
@@ -85,18 +81,21 @@ class Timeout(object):
         known to take extra long on slow, or virtualised hardware.
 
         """
-        timeout = float(get_long_timeout_period())
-        # Once we only support py3.3, replace this with
-        # yield from _do_timeout(timeout)
-        for i in _do_timeout(timeout):
-            yield i
-
-
-def _do_timeout(timeout):
-    time_elapsed = 0.0
-    while timeout - time_elapsed > 0.0:
+        yield from _do_timeout(float(get_long_timeout_period()))
+
+
+def _do_timeout(timeout, _sleep=sleep, _clock=sleep.monotonic):
+    # Drive the loop from a monotonic clock rather than summing the sleep
+    # periods, so time spent in the polling code counts towards the timeout.
+    # sleep and its clock are bound as default arguments to keep global
+    # lookups out of every polling loop.
+    start = _clock()
+    while True:
+        time_elapsed = _clock() - start
+        if time_elapsed >= timeout:
+            break
         yield time_elapsed
-        time_to_sleep = min(timeout - time_elapsed, 1.0)
-        sleep(time_to_sleep)
-        time_elapsed += time_to_sleep
+        time_left = timeout - (_clock() - start)
+        if time_left > 0.0:
+            _sleep(min(time_left, 1.0))
     yield time_elapsed
@@ -1,13 +1,38 @@
 import time
 
-from pykeyboard import PyKeyboard
-
 from rocketpilot.introspection import ProxyBase
 from rocketpilot.input import Mouse
 from rocketpilot.exceptions import StateNotFoundError
+from rocketpilot.utilities import cached_result
+
+
+@cached_result
+def _get_mouse():
+    return Mouse()
+
+
+@cached_result
+def _get_keyboard():
+    # Creating the keyboard opens a connection to the display server, so
+    # defer it (and the import) until the first proxy object needs it.
+    from pykeyboard import PyKeyboard
+    return PyKeyboard()
+
 
-mouse_obj = Mouse()
-keyboard_obj = PyKeyboard()
+_lazy_module_attributes = {
+    'mouse_obj': _get_mouse,
+    'keyboard_obj': _get_keyboard,
+}
+
+
+def __getattr__(name):
+    # Keep the shared mouse_obj and keyboard_obj module attributes working
+    # while only creating them when first accessed.
+    factory = _lazy_module_attributes.get(name)
+    if factory is None:
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name))
+    return factory()
 
 
 class ApplicationItemProxy(ProxyBase):
@@ -15,8 +40,8 @@ class ApplicationItemProxy(ProxyBase):
     def __init__(self, state_dict, path, backend):
         super().__init__(state_dict, path, backend)
 
-        self.mouse = mouse_obj
-        self.keyboard = keyboard_obj
+        self.mouse = _get_mouse()
+        self.keyboard = _get_keyboard()
 
     def click(self, **kwargs):
         self.mouse.move_to_object(self)
@@ -32,9 +57,7 @@ class ApplicationItemProxy(ProxyBase):
     def wait_object_chain(self, object_names):
         current_item = self
 
-        while len(object_names):
-            obj_name = object_names.pop(0)
-
+        for obj_name in object_names:
             current_item = current_item.wait_select_single(
                 objectName=obj_name
             )
@@ -50,14 +73,15 @@ class ApplicationItemProxy(ProxyBase):
             ap_query_timeout = 1
             delay = 0
 
-        for i in range(ap_query_timeout):
+        for attempt in range(ap_query_timeout):
+            if attempt:
+                time.sleep(delay)
+                self.refresh_state()
+
             for filters in filter_groups:
                 try:
                     return self._select_single(type_name, **filters)
                 except StateNotFoundError:
                     continue
 
-            time.sleep(delay)
-            self.refresh_state()
-
         raise StateNotFoundError(type_name)
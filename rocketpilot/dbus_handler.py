@@ -24,6 +24,8 @@ from dbus._dbus import BusConnection
 import dbus
 from dbus.mainloop.glib import DBusGMainLoop
 
+from rocketpilot.utilities import cached_result
+
 
 _glib_loop_set = False
 
@@ -39,6 +41,7 @@ def _ensure_glib_loop_set():
         _glib_loop_set = True
 
 
+@cached_result
 def get_session_bus():
     """Return a session bus that has had the DBus GLib main loop
     initialised.
@@ -48,6 +51,7 @@ def get_session_bus():
     return dbus.SessionBus()
 
 
+@cached_result
 def get_system_bus():
     """Return a system bus that has had the DBus GLib main loop
     initialised.
@@ -57,10 +61,20 @@ def get_system_bus():
     return dbus.SystemBus()
 
 
+_custom_buses = {}
+
+
 def get_custom_bus(bus_address):
     """Return a custom bus that has had the DBus GLib main loop
     initialised.
 
+    The connection is opened once per bus address and reused afterwards,
+    unless it has since been disconnected (e.g. the bus daemon restarted), in
+    which case a new connection is opened.
+
     """
-    _ensure_glib_loop_set()
-    return BusConnection(bus_address)
+    bus = _custom_buses.get(bus_address)
+    if bus is None or not bus.get_is_connected():
+        _ensure_glib_loop_set()
+        bus = _custom_buses[bus_address] = BusConnection(bus_address)
+    return bus
@@ -25,14 +25,14 @@ _log_verbose = False
 
 def get_log_verbose():
     """Return true if the user asked for verbose logging."""
-    global _log_verbose
     return _log_verbose
 
 
 def set_log_verbose(verbose):
     """Set whether or not we should log verbosely."""
     global _log_verbose
-    if type(verbose) is not bool:
+    # The check is compiled out when running under 'python -O'.
+    if __debug__ and type(verbose) is not bool:
         raise TypeError("Verbose flag must be a boolean.")
     _log_verbose = verbose
 
@@ -46,7 +46,6 @@ def set_default_timeout_period(new_timeout):
 
 
 def get_default_timeout_period():
-    global _default_timeout_value
     return _default_timeout_value
 
 
@@ -59,7 +58,6 @@ def set_long_timeout_period(new_timeout):
 
 
 def get_long_timeout_period():
-    global _long_timeout_value
     return _long_timeout_value
 
 
@@ -73,5 +71,4 @@ def set_test_timeout(new_timeout):
 
 
 def get_test_timeout():
-    global _test_timeout
     return _test_timeout
@@ -1,10 +1,14 @@
 import logging
+from contextlib import contextmanager
 
 from pymouse import PyMouse
 
 
 _logger = logging.getLogger(__name__)
 
+# Sentinel for position attributes that the object does not have.
+_MISSING = object()
+
 
 class Mouse(PyMouse):
 
@@ -68,28 +72,31 @@ def get_center_point(object_proxy, offset_x=None, offset_y=None):
     def get_offsets(w, h):
         return offset_x or w//2, offset_y or h//2
 
-    try:
-        x, y, w, h = object_proxy.globalRect
-        _logger.debug("Moving to object's globalRect coordinates.")
-        o_x, o_y = get_offsets(w, h)
-        return x + o_x, y + o_y
-    except AttributeError:
-        pass
-    except (TypeError, ValueError):
-        raise ValueError(
-            "Object '%r' has globalRect attribute, but it is not of the "
-            "correct type" % object_proxy)
+    global_rect = getattr(object_proxy, 'globalRect', _MISSING)
+    if global_rect is not _MISSING:
+        try:
+            x, y, w, h = global_rect
+            _logger.debug("Moving to object's globalRect coordinates.")
+            o_x, o_y = get_offsets(w, h)
+            return x + o_x, y + o_y
+        except (TypeError, ValueError):
+            raise ValueError(
+                "Object '%r' has globalRect attribute, but it is not of the "
+                "correct type" % object_proxy)
+
+    center_x = getattr(object_proxy, 'center_x', _MISSING)
+    if center_x is not _MISSING:
+        with _state_snapshot(object_proxy):
+            center_y = getattr(object_proxy, 'center_y', _MISSING)
+        if center_y is not _MISSING:
+            _logger.debug(
+                "Moving to object's center_x, center_y coordinates.")
+            return center_x, center_y
 
     try:
-        x, y = object_proxy.center_x, object_proxy.center_y
-        _logger.debug("Moving to object's center_x, center_y coordinates.")
-        return x, y
-    except AttributeError:
-        pass
-
-    try:
-        x, y, w, h = (
-            object_proxy.x, object_proxy.y, object_proxy.width, object_proxy.height)
+        x = object_proxy.x
+        with _state_snapshot(object_proxy):
+            y, w, h = object_proxy.y, object_proxy.width, object_proxy.height
         _logger.debug(
             "Moving to object's center point calculated from x,y,w,h "
             "attributes.")
@@ -103,3 +110,22 @@ def get_center_point(object_proxy, offset_x=None, offset_y=None):
         raise ValueError(
             "Object '%r' has x,y attribute, but they are not of the correct "
             "type" % object_proxy)
+
+
+@contextmanager
+def _state_snapshot(object_proxy):
+    """Read attributes of *object_proxy* without refreshing its state.
+
+    Introspection proxies fetch fresh state from the application on every
+    attribute read. Reading one attribute before entering this context and
+    the rest inside it costs a single round-trip, and the values all come
+    from the same snapshot.
+
+    """
+    no_automatic_refreshing = getattr(
+        object_proxy, 'no_automatic_refreshing', None)
+    if no_automatic_refreshing is None:
+        yield
+    else:
+        with no_automatic_refreshing():
+            yield
@@ -26,7 +26,6 @@ from functools import partial
 from operator import methodcaller
 
 import dbus
-import psutil
 
 from rocketpilot import dbus_handler, constants
 from rocketpilot._timeout import Timeout
@@ -663,6 +662,7 @@ class _cached_get_child_pids(object):
 
     def __call__(self, pid):
         if self._cached_result is None:
+            import psutil
             self._cached_result = [
                 p.pid for p in psutil.Process(pid).children(recursive=True)
             ]
@@ -35,7 +35,6 @@ import logging
 from collections import namedtuple
 
 import dbus
-import psutil
 
 from rocketpilot.constants import (
     AP_INTROSPECTION_IFACE,
@@ -62,7 +61,7 @@ class WireProtocolVersionMismatch(RuntimeError):
 class DBusAddress(object):
     """Store information about an Autopilot dbus backend, from keyword
     arguments."""
-    _checked_backends = []
+    _checked_backends = set()
 
     AddrTuple = namedtuple(
         'AddressTuple', ['bus', 'connection', 'object_path'])
@@ -122,7 +121,7 @@ class DBusAddress(object):
             except WireProtocolVersionMismatch:
                 raise
             else:
-                DBusAddress._checked_backends.append(self._addr_tuple)
+                DBusAddress._checked_backends.add(self._addr_tuple)
         return iface
 
     def _check_version(self, iface):
@@ -143,6 +142,7 @@ class DBusAddress(object):
             )
 
     def _check_pid_running(self):
+        import psutil
         try:
             process_pid = _get_bus_connections_pid(
                 self._addr_tuple.bus,
@@ -211,7 +211,7 @@ class Backend(object):
 
     def execute_query_get_data(self, query):
         """Execute 'query', return the raw dbus reply."""
-        with Timer("GetState %r" % query):
+        with Timer("GetState %r", query):
             try:
                 data = self.ipc_address.introspection_iface.GetState(
                     query.server_query_bytes()
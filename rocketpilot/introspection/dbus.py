@@ -737,11 +737,14 @@ class DBusIntrospectionObject(DBusIntrospectionObjectBase):
         loop, or if you want to atomicaly check several attributes at once.
 
         """
+        # Restore the previous value rather than forcing refreshing back on,
+        # so nested uses don't re-enable refreshing for an outer block.
+        refresh_on_attribute = self.__refresh_on_attribute
         try:
             self.__refresh_on_attribute = False
             yield
         finally:
-            self.__refresh_on_attribute = True
+            self.__refresh_on_attribute = refresh_on_attribute
 
     @classmethod
     def validate_dbus_object(cls, path, _state):
@@ -17,7 +17,6 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-import psutil
 from dbus import Interface
 
 
@@ -65,8 +64,9 @@ def get_pid_for_process(process_name):
     if not isinstance(process_name, str):
         raise ValueError('Process name must be a string.')
 
-    pids = [process.pid for process in psutil.process_iter()
-            if process.name() == process_name]
+    import psutil
+    pids = [process.pid for process in psutil.process_iter(['name'])
+            if process.info['name'] == process_name]
 
     if not pids:
         raise ValueError('Process \'{}\' not running'.format(process_name))
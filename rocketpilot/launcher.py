@@ -21,17 +21,18 @@
 
 import logging
 import os
-import psutil
+import shutil
 import subprocess
 import signal
 import sys
 
 from rocketpilot import constants
 from rocketpilot.application import ApplicationItemProxy
-from rocketpilot._timeout import Timeout
+from rocketpilot.globals import get_default_timeout_period
 from rocketpilot.introspection import (
     get_proxy_object_for_existing_process,
 )
+from rocketpilot.utilities import cached_result
 
 _logger = logging.getLogger(__name__)
 
@@ -104,12 +105,13 @@ class ApplicationLauncher(object):
         if arguments is None:
             arguments = []
 
-        _logger.info(
-            "Attempting to launch application '%s' with arguments '%s' as a "
-            "normal process",
-            application,
-            ' '.join(arguments)
-        )
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info(
+                "Attempting to launch application '%s' with arguments '%s' "
+                "as a normal process",
+                application,
+                ' '.join(arguments)
+            )
         self._app_path = app_path = _get_application_path(application)
         app_path, arguments = self._setup_environment(app_path, arguments)
         self._process = process = self._launch_application_process(
@@ -123,6 +125,21 @@ class ApplicationLauncher(object):
         proxy_object.set_process(process)
         return proxy_object
 
+    def prefetch(self, applications):
+        """Resolve the paths of several applications ahead of time.
+
+        Application paths are cached once resolved for the current PATH and
+        working directory, so calling this from a test's setUp moves the PATH
+        lookups out of the timed test body.
+
+        :param applications: An iterable of application names or paths, as
+            accepted by :meth:`launch`.
+        :raises ValueError: if one of the applications cannot be found.
+
+        """
+        for application in applications:
+            _get_application_path(application)
+
     def _setup_environment(self, app_path, arguments):
         return self._prepare_app_env(
             app_path,
@@ -143,11 +160,11 @@ class ApplicationLauncher(object):
 
     def _prepare_app_env(self, app_path, arguments):
         if '-testability' not in arguments:
-            insert_pos = 0
-            for pos, argument in enumerate(arguments):
-                if argument.startswith("-qt="):
-                    insert_pos = pos + 1
-                    break
+            insert_pos = next(
+                (pos + 1 for pos, argument in enumerate(arguments)
+                 if argument.startswith("-qt=")),
+                0
+            )
             arguments.insert(insert_pos, '-testability')
 
         return app_path, arguments
@@ -162,8 +179,7 @@ class ApplicationLauncher(object):
 
 def launch_process(application, args, capture_output=False, **kwargs):
     """Launch an autopilot-enabled process and return the process object."""
-    commandline = [application]
-    commandline.extend(args)
+    commandline = [application, *args]
     _logger.info("Launching process: %r", commandline)
     cap_mode = None
     if capture_output:
@@ -186,41 +202,46 @@ def _get_application_path(application):
     if sys.platform == "win32":
         return application
 
-    try:
-        return subprocess.check_output(
-            ['which', application],
-            universal_newlines=True
-        ).strip()
-    except subprocess.CalledProcessError as e:
+    app_path = _which(application, os.environ.get('PATH'), os.getcwd())
+    if app_path is None:
         raise ValueError(
             "Unable to find path for application {app}: {reason}"
-                .format(app=application, reason=str(e))
+                .format(app=application, reason="not found in PATH")
         )
+    return app_path
+
+
+@cached_result
+def _which(application, path, cwd):
+    # PATH and the working directory are part of the cache key so that
+    # changes to either (shim directories, relative paths) are picked up.
+    return shutil.which(application, path=path)
 
 
 def _kill_process(process):
     """Kill the process, and return the stdout, stderr and return code."""
-    stdout_parts = []
-    stderr_parts = []
     _logger.info("waiting for process to exit.")
     _attempt_kill_pid(process.pid)
-    for _ in Timeout.default():
-        tmp_out, tmp_err = process.communicate()
-        if isinstance(tmp_out, bytes):
-            tmp_out = tmp_out.decode('utf-8', errors='replace')
-        if isinstance(tmp_err, bytes):
-            tmp_err = tmp_err.decode('utf-8', errors='replace')
-        stdout_parts.append(tmp_out)
-        stderr_parts.append(tmp_err)
-        if not psutil.pid_exists(process.pid):
-            break
-    else:
+    timeout = get_default_timeout_period()
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
         _logger.info(
             "Killing process group, since it hasn't exited after "
-            "10 seconds."
+            "%s seconds.",
+            timeout
         )
         _attempt_kill_pid(process.pid, signal.SIGKILL)
-    return ''.join(stdout_parts), ''.join(stderr_parts), process.returncode
+        stdout, stderr = process.communicate()
+    return _decode_output(stdout), _decode_output(stderr), process.returncode
+
+
+def _decode_output(output):
+    if output is None:
+        return ''
+    if isinstance(output, bytes):
+        return output.decode('utf-8', errors='replace')
+    return output
 
 
 def _attempt_kill_pid(pid, sig=signal.SIGTERM):
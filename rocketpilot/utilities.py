@@ -164,10 +164,16 @@ class LogFormatter(logging.Formatter):
 class Timer(object):
 
     """A context-manager that times a block of code, writing the results to
-    the log."""
+    the log.
 
-    def __init__(self, code_name, log_level=logging.DEBUG):
+    Any positional arguments after *code_name* are %-formatted into it, but
+    only when the timing is actually logged.
+
+    """
+
+    def __init__(self, code_name, *code_args, log_level=logging.DEBUG):
         self.code_name = code_name
+        self.code_args = code_args
         self.log_level = log_level
         self.start = 0
         self.logger = get_debug_logger()
@@ -177,9 +183,17 @@ class Timer(object):
 
     def __exit__(self, *args):
         self.end = timeit.default_timer()
+        # Timers wrap every DBus query, so don't build log records that the
+        # debug log filter is going to throw away.
+        if not DebugLogFilter.debug_log_enabled or \
+                not self.logger.isEnabledFor(self.log_level):
+            return
         elapsed = self.end - self.start
+        code_name = self.code_name
+        if self.code_args:
+            code_name = code_name % self.code_args
         self.logger.log(
-            self.log_level, "'%s' took %.3fs", self.code_name, elapsed)
+            self.log_level, "'%s' took %.3fs", code_name, elapsed)
 
 
 class StagnantStateDetector(object):
@@ -250,7 +264,8 @@ def get_debug_logger():
 
     """
     logger = logging.getLogger("autopilot.debug")
-    logger.addFilter(DebugLogFilter())
+    if not any(isinstance(f, DebugLogFilter) for f in logger.filters):
+        logger.addFilter(DebugLogFilter())
     return logger
 
 
@@ -327,6 +342,18 @@ class MockableSleep(object):
         finally:
             self.disable_mock()
 
+    def monotonic(self):
+        """Return the current value of a monotonic clock.
+
+        When sleep is mocked, the clock only advances by the time spent in
+        mocked sleep calls, so polling loops driven by it still terminate
+        without any real delay.
+
+        """
+        if not self._mocked:
+            return time.monotonic()
+        return self._mock_count
+
     def enable_mock(self):
         self._mocked = True
         self._mock_count = 0.0